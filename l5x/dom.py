@@ -2,7 +2,16 @@
 Internal XML DOM helper inteface objects.
 """
 
-import xml.etree.ElementTree as ElementTree
+# Use the C-accelerated ElementTree implementation where it is provided as
+# a separate module, i.e., Python 2.7; Python 3 selects the accelerator
+# automatically and no longer supplies cElementTree. All other modules,
+# including unit tests, import ElementTree from here so elements from
+# differing implementations are never mixed in the same document.
+try:
+    import xml.etree.cElementTree as ElementTree
+except ImportError:
+    import xml.etree.ElementTree as ElementTree
+import weakref
 
 
 # Logix uses CDATA sections to enclose certain content, such as rung
@@ -208,6 +217,8 @@ class ElementDescription(object):
 
 class AttributeDescriptor(object):
     """Generic descriptor class for accessing an XML element's attribute."""
+    __slots__ = ('name', 'read_only')
+
     def __init__(self, name, read_only=False):
         self.name = name
         self.read_only = read_only
@@ -257,7 +268,7 @@ class ElementDictNames(object):
     """Descriptor class to get a list of an ElementDict's members."""
     def __get__(self, instance, owner=None):
         return [instance.key_type(e.attrib[instance.key_attr])
-                for e in instance.parent.iterfind('*')]
+                for e in instance.parent]
 
     def __set__(self, instance, owner=None):
         """Raises an exception upon an attempt to modify; this is read-only."""
@@ -269,14 +280,15 @@ class ElementDict(object):
 
     Operates similar to a dictionary where a child element is referenced
     by index notation to find the child with the matching key attribute.
-    Instead of returning the actual XML element, a new object is
-    instantiated and returned which is used to handle access to the child's
-    data.
+    Instead of returning the actual XML element, an object is instantiated
+    and returned which is used to handle access to the child's data. These
+    objects are retained while in use elsewhere, so repeated lookups of the
+    same child yield the same object instead of creating a new one.
     """
     names = ElementDictNames()
 
     def __init__(self, parent, key_attr, value_type, type_attr=None,
-                 dfl_type=None, key_type=str, value_args=[]):
+                 dfl_type=None, key_type=str, value_args=[], child_index=None):
         self.parent = parent
         self.key_attr = key_attr
         self.value_type = value_type
@@ -285,13 +297,78 @@ class ElementDict(object):
         self.key_type = key_type
         self.value_args = value_args
 
+        # Child elements keyed by their key attribute value, along with
+        # each child's position under the parent; built upon first lookup.
+        # Containers for the same parent and key attribute may share an
+        # index by passing another container's child_index.
+        if child_index is None:
+            child_index = {}
+        self.child_index = child_index
+
+        # Value objects keyed by their child element. Entries are discarded
+        # automatically once a value object is no longer referenced.
+        self.value_cache = weakref.WeakValueDictionary()
+
     def __getitem__(self, key):
         """Return a member class suitable for accessing a child element."""
-        xpath = "*[@{0}='{1}']".format(self.key_attr, key)
-        element = self.parent.find(xpath)
+        element = self.find_child("{0}".format(key))
         if element is None:
             raise KeyError("{0} not found".format(key))
-        return self.create_value_object(element)
+
+        try:
+            return self.value_cache[element]
+        except KeyError:
+            pass
+
+        value = self.create_value_object(element)
+
+        # Value types that do not support weak references are simply
+        # not retained.
+        try:
+            self.value_cache[element] = value
+        except TypeError:
+            pass
+
+        return value
+
+    def find_child(self, key):
+        """Locates the child element with a given key attribute value.
+
+        Children are found via the index instead of searching the parent
+        for every lookup. The parent's children may be altered after the
+        index is built, e.g., when an array is resized, so an indexed child
+        is used only if it is still at the same position with the same key;
+        otherwise the index is rebuilt. Returns None if no child matches.
+        """
+        try:
+            position, element = self.child_index[key]
+        except KeyError:
+            pass
+        else:
+            if ((position < len(self.parent))
+                and (self.parent[position] is element)
+                and (element.get(self.key_attr) == key)):
+                return element
+
+        self.build_index()
+        try:
+            return self.child_index[key][1]
+        except KeyError:
+            return None
+
+    def build_index(self):
+        """Generates the index of child elements from the parent.
+
+        Only the first child is indexed if several share the same key.
+        The existing index is updated in place so containers sharing it
+        see the rebuilt index.
+        """
+        index = self.child_index
+        index.clear()
+        for position, element in enumerate(self.parent):
+            key = element.get(self.key_attr)
+            if (key is not None) and (key not in index):
+                index[key] = (position, element)
 
     def create_value_object(self, element):
         """Instantiates an object returned as the value."""
@@ -3,25 +3,69 @@ Objects for accessing a set of I/O modules.
 """
 
 from .dom import (ElementDict, AttributeDescriptor)
+import re
+
+
+# Pattern for validating new SNN values after underscores are removed.
+SNN_PATTERN = re.compile(r'[0-9A-Fa-f]+\Z')
+
+# Conversions between boolean XML attribute strings and Python values.
+# Boolean attribute values are in lower-case; anything other than 'true'
+# is read as False.
+BOOL_FROM_XML = {'true':True, 'false':False}
+BOOL_TO_XML = {True:'true', False:'false'}
 
 
 class SafetyNetworkNumber(object):
-    """Descriptor class for accessing safety network numbers."""
+    """Descriptor class for accessing safety network numbers.
+
+    Descriptors created with immutable set to True retain each SNN in the
+    accessor object's cache_attr attribute after it is first read, and only
+    discard it when it is set through the same descriptor. The accessor
+    class must provide that attribute, either as a slot or via __dict__,
+    and each immutable descriptor on a class needs its own cache_attr.
+    This is only suitable if the SafetyNetwork attribute is not otherwise
+    modified, including via other descriptors targeting the same element,
+    such as the controller and its first module.
+    """
+    __slots__ = ('element_path', 'cache_attr')
     ATTRIBUTE_NAME = 'SafetyNetwork'
     PREFIX = '16#0000'
+    PREFIX_LENGTH = len(PREFIX)
 
-    def __init__(self, element_path='.'):
+    # Template for the complete attribute value; the radix prefix followed
+    # by each 16-bit word as zero-padded hex separated by underscores.
+    FORMAT = PREFIX + '_{0:04X}_{1:04X}_{2:04X}'
+
+    def __init__(self, element_path='.', immutable=False,
+                 cache_attr='snn_cache'):
         self.element_path = element_path
 
+        # Name of the accessor attribute holding the retained SNN; None
+        # disables retention.
+        if immutable:
+            self.cache_attr = cache_attr
+        else:
+            self.cache_attr = None
+
     def __get__(self, instance, owner=None):
         """Returns the current SNN.
 
         Removes the prefix, unused 16 most-significant bits, and underscores.
         """
+        if self.cache_attr is not None:
+            try:
+                return getattr(instance, self.cache_attr)
+            except AttributeError:
+                pass
+
         element = self.get_target_element(instance)
-        self.check_is_safety(element)
-        snn = element.attrib[self.ATTRIBUTE_NAME][len(self.PREFIX):]
-        return snn.replace('_', '')
+        snn = self.check_is_safety(element)[self.PREFIX_LENGTH:]
+        snn = snn.replace('_', '')
+
+        if self.cache_attr is not None:
+            self.retain(instance, snn)
+        return snn
 
     def __set__(self, instance, value):
         """Sets a new SNN."""
@@ -32,46 +76,61 @@ class SafetyNetworkNumber(object):
         new = value.replace('_', '')
 
         # Ensure valid hex string.
-        try:
-            x = int(new, 16)
-        except ValueError:
+        if SNN_PATTERN.match(new) is None:
             raise ValueError('Safety network number must be a hex string')
+        x = int(new, 16)
 
-        # Generate a zero-padded string and enforce 24-bit limit.
-        padded = "{0:012X}".format(x)
-        if not len(padded) == 12:
+        # Enforce the 12 hex character limit.
+        if x >> 48:
             raise ValueError('Value must be 24-bit, 12 hex characters')
 
-        # Add radix prefix and insert underscores for the final output string.
-        fields = [self.PREFIX]
-        for word in range(3):
-            start = word * 4
-            end = start + 4
-            fields.append(padded[start:end])
+        element.attrib[self.ATTRIBUTE_NAME] = self.FORMAT.format(
+            x >> 32, (x >> 16) & 0xFFFF, x & 0xFFFF)
+
+        if self.cache_attr is not None:
+            try:
+                delattr(instance, self.cache_attr)
+            except AttributeError:
+                pass
 
-        element.attrib[self.ATTRIBUTE_NAME] = '_'.join(fields)
+    def retain(self, instance, snn):
+        """Stores a SNN in the accessor object's cache attribute."""
+        try:
+            setattr(instance, self.cache_attr, snn)
+        except AttributeError:
+            msg = "{0} objects have no '{1}' attribute to retain the " \
+                  "safety network number".format(type(instance).__name__,
+                                                 self.cache_attr)
+            raise AttributeError(msg)
 
     def get_target_element(self, instance):
         """Finds the element containing the safety network number attribute."""
+        # Most SNNs reside in the instance's own element; skip the path
+        # search in that case.
+        if self.element_path == '.':
+            return instance.element
         return instance.element.find(self.element_path)
 
     def check_is_safety(self, element):
-        """Confirms the target port/module is safety and has a SNN."""
-        try:
-            element.attrib[self.ATTRIBUTE_NAME]
-        except KeyError:
-            try:
-                id = element.attrib['Name']
-            except KeyError:
-                id = "{0}({1})".format(element.attrib['Id'],
-                                       element.attrib['Type'])
+        """Confirms the target port/module is safety and has a SNN.
+
+        Returns the raw SNN attribute value.
+        """
+        snn = element.get(self.ATTRIBUTE_NAME)
+        if snn is None:
+            id = element.get('Name')
+            if id is None:
+                id = "{0}({1})".format(element.get('Id'), element.get('Type'))
             msg = "{0} {1} does not support a safety network number.".format(
                 element.tag, id)
             raise TypeError(msg)
+        return snn
 
 
 class NatAddress(AttributeDescriptor):
     """Descriptor class for accessing port NAT addresses."""
+    __slots__ = ()
+
     def to_xml(self, port, new_address):
         """
         Override for the default converter method to enforce custom validations
@@ -79,7 +138,7 @@ class NatAddress(AttributeDescriptor):
         """
         # The port must already be configured for NAT, i.e. the NAT XML
         # attribute must already exist.
-        if not self.name in port.element.attrib:
+        if self.name not in port.element.attrib:
             raise TypeError("Port {0}({1}) is not configured for NAT.".format(
                 port.element.attrib["Id"], port.element.attrib["Type"]))
 
@@ -90,54 +149,65 @@ class NatAddress(AttributeDescriptor):
         return new_address
 
 
-class Inhibited(AttributeDescriptor):
-    """Descriptor class for the module inhibit attribute.
+class BoolAttribute(AttributeDescriptor):
+    """Descriptor class for boolean module attributes.
 
     Handles conversions between the XML attribute string and boolean values.
+    The label identifies the attribute in error messages.
     """
+    __slots__ = ('label',)
+
+    def __init__(self, name, label):
+        AttributeDescriptor.__init__(self, name)
+        self.label = label
 
     def from_xml(self, raw):
         """Converts the XML attribute string into a boolean value."""
-        return True if raw == 'true' else False
+        return BOOL_FROM_XML.get(raw, False)
 
     def to_xml(self, unused, value):
         """Converts a boolean value into an XML attribute string."""
         if not isinstance(value, bool):
-            raise TypeError("Module inhibit value must be a bool.")
+            raise TypeError("Module {0} value must be a bool.".format(
+                self.label))
+        return BOOL_TO_XML[value]
 
-        # Boolean attribute values are in lower-case.
-        return str(value).lower()
 
+class ModulePorts(object):
+    """Descriptor class for accessing a module's ports.
 
-class MajorFault(AttributeDescriptor):
-    """Descriptor class for the module MajorFault attribute.
-
-    Handles conversions between the XML attribute string and boolean values.
+    The port container is created the first time the ports are accessed
+    instead of when the module object is created, so modules used only for
+    attributes such as the SNN or inhibit status never search for the
+    Ports element. The container is then kept by the module for
+    subsequent accesses.
     """
+    def __get__(self, module, owner=None):
+        try:
+            return module.port_dict
+        except AttributeError:
+            ports_element = module.element.find('Ports')
+            module.port_dict = ElementDict(ports_element, 'Id', Port,
+                                           key_type=int)
+            return module.port_dict
 
-    def from_xml(self, raw):
-        """Converts the XML attribute string into a boolean value."""
-        return True if raw == 'true' else False
-
-    def to_xml(self, unused, value):
-        """Converts a boolean value into an XML attribute string."""
-        if not isinstance(value, bool):
-            raise TypeError("Module MajorFault value must be a bool.")
-
-        # Boolean attribute values are in lower-case.
-        return str(value).lower()
+    def __set__(self, module, value):
+        """Raises an exception upon an attempt to modify; this is read-only."""
+        raise AttributeError('Read-only attribute.')
 
 
 class Module(object):
     """Accessor object for a communication module."""
     snn = SafetyNetworkNumber()
-    inhibited = Inhibited('Inhibited')
-    majorfault = MajorFault('MajorFault')
-    
+    inhibited = BoolAttribute('Inhibited', 'inhibit')
+    majorfault = BoolAttribute('MajorFault', 'MajorFault')
+    ports = ModulePorts()
+
+    # Weak references are required by the ElementDict value cache.
+    __slots__ = ('element', 'port_dict', '__weakref__')
+
     def __init__(self, element):
         self.element = element
-        ports_element = element.find('Ports')
-        self.ports = ElementDict(ports_element, 'Id', Port, key_type=int)
 
 
 class Port(object):
@@ -146,6 +216,7 @@ class Port(object):
     nat_address = NatAddress('NATActualAddress')
     type = AttributeDescriptor('Type', True)
     snn = SafetyNetworkNumber()
+    __slots__ = ('element', '__weakref__')
 
     def __init__(self, element):
         self.element = element
@@ -10,12 +10,11 @@ __get__() method. In this way the application can process L5X projects
 without worrying about low-level XML handling.
 """
 
-from .dom import (CDATA_TAG, ElementDict, AttributeDescriptor)
+from .dom import (CDATA_TAG, ElementDict, AttributeDescriptor, ElementTree)
 from .module import (Module, SafetyNetworkNumber)
 from .tag import Scope
 import io
 import re
-import xml.etree.ElementTree as ElementTree
 import xml.dom.minidom
 
 
@@ -60,15 +59,13 @@ class Project(object):
         except TypeError:
             f = filename
 
+        # Swap out CDATA sections before parsing. The (unicode) string then
+        # needs to be converted back to a series of bytes before ElementTree
+        # parses it. This is done in a single expression so neither the
+        # original nor the intermediate text remains referenced while the
+        # document is parsed, limiting peak memory for large projects.
         with f:
-            orig = f.read()
-
-        # Swap out CDATA sections before parsing.
-        cdata_replaced = self.convert_to_cdata_element(orig)
-
-        # The (unicode) string needs to be converted back to a series
-        # of bytes before ElementTree parses it.
-        encoded = cdata_replaced.encode('UTF-8')
+            encoded = self.convert_to_cdata_element(f.read()).encode('UTF-8')
 
         try:
             self.doc = ElementTree.fromstring(encoded)
@@ -3,10 +3,9 @@ Objects implementing tag access.
 """
 
 from l5x import dom
+from l5x.dom import ElementTree
 import copy
-import ctypes
 import itertools
-import xml.etree.ElementTree as ElementTree
 
 
 class Scope(object):
@@ -132,17 +131,10 @@ class Tag(object):
         Called anytime a data value is set to avoid conflicts with
         modified decorated data elements.
         """
-        undecorated_data = []
-        for e in self.element.iterfind('Data'):
-            try:
-                format = e.attrib['Format']
-            except KeyError:
-                undecorated_data.append(e)
-            else:
-                if format != 'Decorated':
-                    undecorated_data.append(e)
-
-        [self.element.remove(e) for e in undecorated_data]
+        undecorated_data = [e for e in self.element.iterfind('Data')
+                            if e.get('Format') != 'Decorated']
+        for e in undecorated_data:
+            self.element.remove(e)
 
 
 class AliasFor(object):
@@ -189,79 +181,69 @@ class Comment(object):
     """
     def __get__(self, instance, owner=None):
         """Returns the data's description."""
-        # Acquire the overall Comments parent element.
-        comments = instance.tag.element.find('Comments')
-        if comments is None:
-            return None
-
-        # Locate the Comment child with the matching operand.
-        try:
-            element = self.get_comment_element(instance, comments)
-        except KeyError:
-            return None
-
-        cdata = dom.get_localized_cdata(element, instance.tag.lang)
+        comments, comment = self.get_elements(instance)
+        cdata = self.get_cdata(instance, comment)
         if cdata is None:
             return None
         return str(cdata)
 
     def __set__(self, instance, value):
         """Updates, creates, or removes a comment."""
+        # Locate the Comments parent and the operand's Comment element
+        # once; creating, modifying, and deleting all reuse them.
+        comments, comment = self.get_elements(instance)
         if value is not None:
-            if self.__get__(instance) is None:
-                self.create(instance, value)
+            cdata = self.get_cdata(instance, comment)
+            if cdata is None:
+                self.create(instance, comments, comment, value)
             else:
-                self.modify(instance, value)
-        else:
-            self.delete(instance)
+                cdata.set(value)
+        elif comment is not None:
+            self.delete(instance, comments, comment)
 
-    def create(self, instance, text):
-        """Creates a new comment."""
-        # Get the parent Comments element, creating one if necessary.
+    def get_elements(self, instance):
+        """Locates the Comments parent and the instance's Comment element.
+
+        Either element is returned as None if it does not exist.
+        """
+        # Acquire the overall Comments parent element.
         comments = instance.tag.element.find('Comments')
         if comments is None:
-            comments = self.create_comments(instance)
+            return (None, None)
 
-        # Find or create a Comment element with matching operand to store
-        # the new comment text.
+        # Locate the Comment child with the matching operand.
         try:
-            # Single-language projects will not have an existing Comment
-            # element because no localized comments are possible in other
-            # languages.
-            if instance.tag.lang is None:
-                raise KeyError()
-
-            # A matching Comment element may already exist in multilanguage
-            # projects, containing comments in other languages.
-            else:
-                comment = self.get_comment_element(instance, comments)
-
-        # Create a new Comment element with the target operand.
+            comment = self.get_comment_element(instance, comments)
         except KeyError:
-            comment = ElementTree.SubElement(comments, 'Comment',
-                                             {'Operand':instance.operand})
+            comment = None
 
-        dom.create_localized_cdata(comment, instance.tag.lang, text)
+        return (comments, comment)
 
-    def modify(self, instance, text):
-        """Alters an existing comment."""
-        comments_parent = instance.tag.element.find('Comments')
-        comment = self.get_comment_element(instance, comments_parent)
-        dom.modify_localized_cdata(comment, instance.tag.lang, text)
+    def get_cdata(self, instance, comment):
+        """Locates the CDATA content of a Comment element, if any."""
+        if comment is None:
+            return None
+        return dom.get_localized_cdata(comment, instance.tag.lang)
 
-    def delete(self, instance):
-        """Removes a comment."""
-        # Acquire the overall Comments parent element.
-        comments = instance.tag.element.find('Comments')
+    def create(self, instance, comments, comment, text):
+        """Creates a new comment."""
+        # Create the parent Comments element if necessary.
         if comments is None:
-            return
+            comments = self.create_comments(instance)
 
-        # Locate the Comment child with the matching operand.
-        try:
-            comment = self.get_comment_element(instance, comments)
-        except KeyError:
-            return
+        # Single-language projects will not have an existing Comment
+        # element because no localized comments are possible in other
+        # languages. A matching Comment element may already exist in
+        # multilanguage projects, containing comments in other languages;
+        # otherwise create a new Comment element with the target operand.
+        if comment is None:
+            comment = ElementTree.SubElement(comments, 'Comment',
+                                             Operand=instance.operand)
+
+        dom.create_localized_cdata(comment, instance.tag.lang, text)
 
+    def delete(self, instance, comments, comment):
+        """Removes a comment."""
         # Remove the Comment or LocalizedComment containing the actual text.
         dom.remove_localized_cdata(comments, comment, instance.tag.lang)
 
@@ -280,7 +262,7 @@ class Comment(object):
         comments = ElementTree.Element('Comments')
 
         # Locate the index of the Data child element.
-        child_tags = [e.tag for e in instance.tag.element.iterfind('*')]
+        child_tags = [e.tag for e in instance.tag.element]
         data_index = child_tags.index('Data')
 
         instance.tag.element.insert(data_index, comments)
@@ -288,11 +270,13 @@ class Comment(object):
 
     def get_comment_element(self, instance, comments):
         """Acquires the Comment element of the instance's operand."""
-        path = "Comment[@Operand='{0}']".format(instance.operand)
-        element = comments.find(path)
-        if element is None:
-            raise KeyError()
-        return element
+        # Comparing the attribute directly avoids building and evaluating
+        # an XPath predicate for every lookup.
+        operand = instance.operand
+        for element in comments.iterfind('Comment'):
+            if element.get('Operand') == operand:
+                return element
+        raise KeyError()
 
 
 class Data(object):
@@ -409,7 +393,6 @@ class Integer(Data):
 class SINT(Integer):
     """Base class for 8-bit signed integers."""
     bits = 8
-    ctype = ctypes.c_int8
     value_min = -128
     value_max = 127
 
@@ -417,7 +400,6 @@ class SINT(Integer):
 class INT(Integer):
     """Base class for 16-bit signed integers."""
     bits = 16
-    ctype = ctypes.c_int16
     value_min = -32768
     value_max = 32767
 
@@ -425,7 +407,6 @@ class INT(Integer):
 class DINT(Integer):
     """Base class for 32-bit signed integers."""
     bits = 32
-    ctype = ctypes.c_int32
     value_min = -2147483648
     value_max = 2147483647
 
@@ -433,14 +414,12 @@ class DINT(Integer):
 class BitValue(object):
     """Descriptor class for values of individual integer bits.
 
-    Bit access utilizes exact-width, signed ctype integers for
-    bit-level operations which are then translated back to the parent
-    integer's value. This ensures correct results when the sign bit
-    is accessed.
+    Bit-level operations are applied to the parent integer's value
+    masked to its width, which is then translated back to a signed
+    value. This ensures correct results when the sign bit is accessed.
     """
     def __get__(self, bit, owner=None):
-        cvalue = self.get_ctype(bit)
-        if cvalue.value & bit.mask.value:
+        if bit.parent.value & bit.mask:
             return 1
         else:
             return 0
@@ -451,16 +430,17 @@ class BitValue(object):
         elif (bit_value < 0) or (bit_value > 1):
             raise ValueError('Bit values may only be 0 or 1')
 
-        cvalue = self.get_ctype(bit)
+        parent = bit.parent
         if bit_value:
-            cvalue.value |= bit.mask.value
+            value = parent.value | bit.mask
         else:
-            cvalue.value &= ~bit.mask.value
-        bit.parent.value = int(cvalue.value)
+            value = parent.value & ~bit.mask
 
-    def get_ctype(self, bit):
-        """Returns the parent integer's value as a ctype."""
-        return bit.parent.ctype(bit.parent.value)
+        # Truncate to the integer's width and restore the sign.
+        value &= (1 << parent.bits) - 1
+        if value > parent.value_max:
+            value -= 1 << parent.bits
+        parent.value = value
 
 
 class Bit(Data):
@@ -471,7 +451,7 @@ class Bit(Data):
     def __init__(self, element, tag, parent, bit):
         self.bit = bit
         Data.__init__(self, element, tag, parent)
-        self.mask = parent.ctype(1 << bit)
+        self.mask = 1 << bit
 
     def build_operand(self):
         """Method override to create an operand based on the bit number."""
@@ -564,8 +544,9 @@ class Structure(Data):
 class ArrayValue(object):
     """Descriptor class for accessing multiple values in an array."""
     def __get__(self, array, owner=None):
-        dim = len(array.shape) - len(array.address) - 1
-        return [array[i].value for i in range(array.shape[dim])]
+        shape = array.shape
+        dim = len(shape) - len(array.address) - 1
+        return [array[i].value for i in range(shape[dim])]
 
     def __set__(self, array, value):
         if not isinstance(value, list):
@@ -609,7 +590,7 @@ class ArrayShape(object):
 
     def __set__(self, array, value):
         # Prevent resizing UDT array members.
-        if not array.element.tag == 'Array':
+        if array.element.tag != 'Array':
             raise AttributeError('Member arrays cannot be resized.')
 
         self.check_shape(value)
@@ -638,7 +619,8 @@ class Array(Data):
     description = ArrayDescription()
     shape = ArrayShape()
 
-    def __init__(self, data_class, element, tag, parent=None, address=[]):
+    def __init__(self, data_class, element, tag, parent=None, address=[],
+                 child_index=None):
         Data.__init__(self, element, tag, parent)
         self.data_class = data_class
         self.address = address
@@ -648,9 +630,11 @@ class Array(Data):
         # the usual list-type access does not suffice. The object initialized
         # here builds a dictionary of child elements(array members) keyed
         # by the Index attribute that can then be accessed with traditional
-        # array notation.
+        # array notation. Subarrays share their parent array's child
+        # index because they access the same member elements.
         self.members = dom.ElementDict(self.element, 'Index', self.data_class,
-                                       value_args=[self.tag, self])
+                                       value_args=[self.tag, self],
+                                       child_index=child_index)
 
     def __getitem__(self, index):
         """Returns an access object for the given index.
@@ -662,20 +646,18 @@ class Array(Data):
         if not isinstance(index, int):
             raise TypeError('Array indices must be integers')
 
-        # Add the given index to the current accumulated address.
-        dim = len(self.shape) - len(self.address) - 1
-        if (index < 0) or (index >= self.shape[dim]):
+        # Add the given index to the current accumulated address. Indices
+        # arrive most-significant first, which is also the display order,
+        # so the address is kept in that order and needs no reversal.
+        shape = self.shape
+        dim = len(shape) - len(self.address) - 1
+        if (index < 0) or (index >= shape[dim]):
             raise IndexError('Array index out of range')
-        new_address = list(self.address)
-        new_address.insert(0, index)
+        new_address = self.address + [index]
 
         # If the newly formed address set satisifies all dimensions
         # return an access object for the member.
-        if len(new_address) == len(self.shape):
-            # Address values are reversed because the display order is
-            # most-significant first.
-            new_address.reverse()
-
+        if len(new_address) == len(shape):
             key = "[{0}]".format(','.join([str(i) for i in new_address]))
             return self.members[key]
 
@@ -685,7 +667,8 @@ class Array(Data):
         # which will result in an Array instance through Data.__new__().
         else:
             return self.data_class(self.element, self.tag, self.parent,
-                                   new_address)
+                                   new_address,
+                                   child_index=self.members.child_index)
 
     def resize(self, new_shape):
         """Alters the array's size."""
@@ -698,8 +681,8 @@ class Array(Data):
         self.remove_elements()
 
         # Generate new elements based on a new set of indices.
-        indices = self.build_new_indices(new_shape)
-        [self.append_element(template, i) for i in indices]
+        for index in self.build_new_indices(new_shape):
+            self.append_element(template, index)
 
     def set_dimensions(self, shape):
         """Updates the Dimensions attributes with a given shape.
@@ -720,7 +703,7 @@ class Array(Data):
 
     def remove_elements(self):
         """Deletes all (array)Element elements."""
-        [self.element.remove(e) for e in self.element.findall('*')]
+        del self.element[:]
 
     def build_new_indices(self, shape):
         """Constructs a set of all indices for a given array shape."""
@@ -3,10 +3,11 @@ Utilities used by all test modules to ensure test output is accumulated into
 a single output file for final validation by RSLogix.
 """
 
+import copy
 import io
 import l5x
+from l5x.dom import ElementTree
 import xml.dom.minidom
-import xml.etree.ElementTree as ElementTree
 
 
 def parse_xml(xml_str):
@@ -27,6 +28,25 @@ def parse_xml(xml_str):
     return parser.doc
 
 
+# Elements parsed by parse_xml_copy(), keyed by their source XML string.
+parsed_xml = {}
+
+
+def parse_xml_copy(xml_str):
+    """Returns a separate copy of the element parsed from an XML string.
+
+    Each distinct string is parsed only once; subsequent calls return a
+    deep copy of the original element, so callers may modify the result
+    without affecting other tests.
+    """
+    try:
+        element = parsed_xml[xml_str]
+    except KeyError:
+        element = parse_xml(xml_str)
+        parsed_xml[xml_str] = element
+    return copy.deepcopy(element)
+
+
 def string_to_project(s):
     """Parses an XML string into a L5X project."""
     # Convert to unicode as needed for Python 2.7.
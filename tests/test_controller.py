@@ -3,8 +3,8 @@ Unit tests for a project's controller object.
 """
 
 from l5x import project
+from l5x.dom import ElementTree
 import unittest
-import xml.etree.ElementTree as ElementTree
 
 
 class Controller(unittest.TestCase):
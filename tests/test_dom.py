@@ -3,8 +3,8 @@ Unit tests for low-level XML interface objects.
 """
 
 from l5x import dom
+from l5x.dom import ElementTree
 import unittest
-import xml.etree.ElementTree as ElementTree
 
 
 class ElementDict(unittest.TestCase):
@@ -15,29 +15,32 @@ class ElementDict(unittest.TestCase):
             self.element = element
             self.args = args
 
+    @classmethod
+    def setUpClass(cls):
+        """
+        Creates a parent with a single child, which also has a child with
+        a key attribute, shared by tests that do not modify the elements.
+        """
+        cls.parent = ElementTree.Element('parent')
+        cls.child = ElementTree.SubElement(cls.parent, 'child', {'key':'foo'})
+        ElementTree.SubElement(cls.child, 'grandchild', {'key':'bar'})
+
     def test_key_attribute_value(self):
         """Confirm values from the key attribute are used for lookup."""
-        parent = ElementTree.Element('parent')
-        child = ElementTree.SubElement(parent, 'child', {'key':'foo'})
-        d = dom.ElementDict(parent, 'key', self.Dummy)
-        self.assertIs(d['foo'].element, child)
+        d = dom.ElementDict(self.parent, 'key', self.Dummy)
+        self.assertIs(d['foo'].element, self.child)
 
     def test_depth_lookup(self):
         """Confirm only direct children are queried for lookup."""
-        parent = ElementTree.Element('parent')
-        child = ElementTree.SubElement(parent, 'child', {'key':'foo'})
-        ElementTree.SubElement(child, 'grandchild', {'key':'bar'})
-        d = dom.ElementDict(parent, 'key', self.Dummy)
+        d = dom.ElementDict(self.parent, 'key', self.Dummy)
         with self.assertRaises(KeyError):
             d['bar']
 
     def test_key_not_found(self):
         """Confirm a KeyError is raised if a matching key doesn't exist."""
-        parent = ElementTree.Element('parent')
-        ElementTree.SubElement(parent, 'child', {'key':'foo'})
-        d = dom.ElementDict(parent, 'key', self.Dummy)
+        d = dom.ElementDict(self.parent, 'key', self.Dummy)
         with self.assertRaises(KeyError):
-            d['bar']
+            d['baz']
 
     def test_key_not_found_empty(self):
         """Confirm a KeyError is raised if the parent has no child elements."""
@@ -48,10 +51,8 @@ class ElementDict(unittest.TestCase):
 
     def test_string_lookup(self):
         """Confirm correct lookup with string keys."""
-        parent = ElementTree.Element('parent')
-        child = ElementTree.SubElement(parent, 'child', {'key':'foo'})
-        d = dom.ElementDict(parent, 'key', self.Dummy)
-        self.assertIs(d['foo'].element, child)
+        d = dom.ElementDict(self.parent, 'key', self.Dummy)
+        self.assertIs(d['foo'].element, self.child)
 
     def test_integer_lookup(self):
         """Confirm correct lookup with integer keys."""
@@ -60,6 +61,57 @@ class ElementDict(unittest.TestCase):
         d = dom.ElementDict(parent, 'key', self.Dummy, key_type=int)
         self.assertIs(d[42].element, child)
 
+    def test_lookup_new_child(self):
+        """Confirm lookup of a child added after a previous lookup."""
+        parent = ElementTree.Element('parent')
+        ElementTree.SubElement(parent, 'child', {'key':'foo'})
+        d = dom.ElementDict(parent, 'key', self.Dummy)
+        d['foo']
+        child = ElementTree.SubElement(parent, 'child', {'key':'bar'})
+        self.assertIs(d['bar'].element, child)
+
+    def test_lookup_replaced_child(self):
+        """
+        Confirm lookup yields a new value object for the new child after a
+        previously accessed child is replaced by another with the same key,
+        even while the old value object is still referenced.
+        """
+        parent = ElementTree.Element('parent')
+        old = ElementTree.SubElement(parent, 'child', {'key':'foo'})
+        d = dom.ElementDict(parent, 'key', self.Dummy)
+        old_value = d['foo']
+        parent.remove(old)
+        new = ElementTree.SubElement(parent, 'child', {'key':'foo'})
+        new_value = d['foo']
+        self.assertIsNot(new_value, old_value)
+        self.assertIs(new_value.element, new)
+
+    def test_shared_child_index(self):
+        """
+        Confirm containers sharing a child index find children indexed by
+        either container, while creating their own value objects.
+        """
+        parent = ElementTree.Element('parent')
+        child = ElementTree.SubElement(parent, 'child', {'key':'foo'})
+        d1 = dom.ElementDict(parent, 'key', self.Dummy)
+        d2 = dom.ElementDict(parent, 'key', self.Dummy,
+                             child_index=d1.child_index)
+        value1 = d1['foo']
+        self.assertIs(d2.child_index, d1.child_index)
+        value2 = d2['foo']
+        self.assertIs(value2.element, child)
+        self.assertIsNot(value2, value1)
+
+    def test_lookup_removed_child(self):
+        """Confirm a KeyError is raised for a child removed after lookup."""
+        parent = ElementTree.Element('parent')
+        child = ElementTree.SubElement(parent, 'child', {'key':'foo'})
+        d = dom.ElementDict(parent, 'key', self.Dummy)
+        d['foo']
+        parent.remove(child)
+        with self.assertRaises(KeyError):
+            d['foo']
+
     def test_value_read_only(self):
         """
         Confirm attempting to assign a different value raises an exception.
@@ -129,21 +181,26 @@ class ElementDict(unittest.TestCase):
         Confirm an instance of the value type is returned when the value
         type is specified as a class.
         """
-        parent = ElementTree.Element('parent')
-        ElementTree.SubElement(parent, 'child', {'key':'foo'})
-        d = dom.ElementDict(parent, 'key', self.Dummy)
+        d = dom.ElementDict(self.parent, 'key', self.Dummy)
         self.assertIsInstance(d['foo'], self.Dummy)
 
+    def test_same_value_object(self):
+        """
+        Confirm repeated lookups of the same key return the same value
+        object while it is still referenced.
+        """
+        d = dom.ElementDict(self.parent, 'key', self.Dummy)
+        value = d['foo']
+        self.assertIs(d['foo'], value)
+
     def test_single_value_type_args(self):
         """
         Confirm the target element and extra arguments are passed to
         the value class for single-type values.
         """
-        parent = ElementTree.Element('parent')
-        child = ElementTree.SubElement(parent, 'child', {'key':'foo'})
-        d = dom.ElementDict(parent, 'key', self.Dummy,
+        d = dom.ElementDict(self.parent, 'key', self.Dummy,
                             value_args=['spam', 'eggs'])
-        self.assertIs(d['foo'].element, child)
+        self.assertIs(d['foo'].element, self.child)
         self.assertEqual(d['foo'].args, ('spam', 'eggs'))
 
     def test_value_type_by_attribute(self):
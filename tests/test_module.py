@@ -110,6 +110,15 @@ class ModuleStandard(unittest.TestCase):
         """Confirm accessing a port returns a Port instance."""
         self.assertIsInstance(self.module.ports[1], module.Port)
 
+    def test_ports_reused(self):
+        """Confirm the same port container is returned for each access."""
+        self.assertIs(self.module.ports, self.module.ports)
+
+    def test_ports_readonly(self):
+        """Ensure an exception is raised when attempting to replace the ports."""
+        with self.assertRaises(AttributeError):
+            self.module.ports = 'foo'
+
     def test_snn_read(self):
         """Confirm reading the SNN raises an exception."""
         with self.assertRaises(TypeError):
@@ -297,6 +306,11 @@ class SafetyNetworkNumber(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.module.snn = '1000000000000'
 
+    def test_negative_snn_value(self):
+        """Confirm setting SNN to a negative value raises an exception."""
+        with self.assertRaises(ValueError):
+            self.module.snn = '-1'
+
     def test_invalid_snn_str(self):
         """Confirm setting SNN to a non-hex value raises an exception."""
         with self.assertRaises(ValueError):
@@ -351,3 +365,106 @@ class Inhibit(unittest.TestCase):
     def _get_inhibit(self):
         """Retrieves the inhibited XML attribute value."""
         return self.module.element.attrib['Inhibited']
+
+
+class MajorFault(unittest.TestCase):
+    """Tests for the module MajorFault attribute."""
+
+    def setUp(self):
+        element = fixture.parse_xml(r'<Module Name="Local"/>')
+        self.module = module.Module(element)
+
+    def test_read(self):
+        """Confirm reading the attribute yields the correct values.
+
+        assertIs() is used for the same reason as in the Inhibit tests.
+        """
+        self._set_majorfault('true')
+        self.assertIs(self.module.majorfault, True)
+
+        self._set_majorfault('false')
+        self.assertIs(self.module.majorfault, False)
+
+    def test_write(self):
+        """Confirm writing valid values yields correct XML values."""
+        self.module.majorfault = True
+        self.assertEqual(self._get_majorfault(), 'true')
+
+        self.module.majorfault = False
+        self.assertEqual(self._get_majorfault(), 'false')
+
+    def test_write_invalid(self):
+        """Confirm exception when writing non-boolean values."""
+        not_bool = [0, 1, 'true', 'false', None]
+        for value in not_bool:
+            with self.assertRaises(TypeError, msg=value):
+                self.module.majorfault = value
+
+    def _set_majorfault(self, value):
+        """Sets the MajorFault XML attribute to a given value."""
+        self.module.element.attrib['MajorFault'] = value
+
+    def _get_majorfault(self):
+        """Retrieves the MajorFault XML attribute value."""
+        return self.module.element.attrib['MajorFault']
+
+
+class ImmutableSafetyNetworkNumber(unittest.TestCase):
+    """Tests for safety network numbers retained after the first read."""
+    class Dummy(object):
+        """Mock accessor object with an immutable SNN."""
+        snn = module.SafetyNetworkNumber(immutable=True)
+        __slots__ = ('element', 'snn_cache')
+
+        def __init__(self, element):
+            self.element = element
+
+    def setUp(self):
+        element = fixture.parse_xml(
+            r'<Port Id="1" SafetyNetwork="16#0000_1337_d00d_0100"/>')
+        self.port = self.Dummy(element)
+
+    def test_read_retained(self):
+        """Confirm the first value read is returned for subsequent reads."""
+        self.assertEqual(self.port.snn, '1337d00d0100')
+        self.port.element.attrib['SafetyNetwork'] = '16#0000_0000_0000_0000'
+        self.assertEqual(self.port.snn, '1337d00d0100')
+
+    def test_write_discards(self):
+        """Confirm writing a new SNN replaces the retained value."""
+        self.port.snn
+        self.port.snn = '0000_1111_2222'
+        self.assertEqual(self.port.snn, '000011112222')
+
+    def test_separate_caches(self):
+        """Confirm descriptors with distinct cache attributes are independent."""
+        class Dummy(object):
+            snn = module.SafetyNetworkNumber(immutable=True)
+            port_snn = module.SafetyNetworkNumber('Port', True, 'port_cache')
+            __slots__ = ('element', 'snn_cache', 'port_cache')
+
+            def __init__(self, element):
+                self.element = element
+
+        element = fixture.parse_xml(
+            r'<Module SafetyNetwork="16#0000_1337_d00d_0100">'
+            r'<Port Id="1" SafetyNetwork="16#0000_0000_0000_0001"/>'
+            r'</Module>')
+        dummy = Dummy(element)
+        self.assertEqual(dummy.snn, '1337d00d0100')
+        self.assertEqual(dummy.port_snn, '000000000001')
+        self.assertEqual(dummy.snn, '1337d00d0100')
+
+    def test_missing_cache_attribute(self):
+        """Confirm a clear exception if the accessor cannot retain the SNN."""
+        class Dummy(object):
+            snn = module.SafetyNetworkNumber(immutable=True)
+            __slots__ = ('element',)
+
+            def __init__(self, element):
+                self.element = element
+
+        dummy = Dummy(self.port.element)
+        with self.assertRaises(AttributeError) as cm:
+            dummy.snn
+        self.assertIn('snn_cache', str(cm.exception))
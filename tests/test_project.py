@@ -6,7 +6,7 @@ import l5x
 import io
 import unittest
 from tests import fixture
-import xml.etree.ElementTree as ElementTree
+from l5x.dom import ElementTree
 import xml.dom.minidom
 
 
@@ -35,12 +35,14 @@ class Parse(unittest.TestCase):
 
 class CDATARemoval(unittest.TestCase):
     """Tests for replacing CDATA sections with elements."""
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
         Creates a dummy project. This is only needed to get a Project
-        instance to test the replace_cdata method.
+        instance to test the replace_cdata method, which does not alter
+        the project, so a single instance is shared by all tests.
         """
-        self.project = fixture.create_project()
+        cls.project = fixture.create_project()
 
     def test_CDATA_to_element(self):
         """Confirm CDATA sections are converted to elements."""
@@ -100,12 +102,14 @@ class CDATARemoval(unittest.TestCase):
 
 class CDATAInsertion(unittest.TestCase):
     """Tests for replacing CDATA elements with CDATA sections."""
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
         Creates a dummy project. This is only needed to get a Project
-        instance to test the CDATA conversion method.
+        instance to test the CDATA conversion method, which does not alter
+        the project, so a single instance is shared by all tests.
         """
-        self.project = fixture.create_project()
+        cls.project = fixture.create_project()
 
     def test_element_to_CDATA(self):
         """Confirm CDATA elements are converted to CDATA sections."""
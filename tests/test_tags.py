@@ -6,17 +6,17 @@ import copy
 import ctypes
 from tests import fixture
 from l5x import (dom, tag)
+from l5x.dom import ElementTree
 import itertools
 import l5x
 import math
 import unittest
-import xml.etree.ElementTree as ElementTree
 
 
 class Scope(unittest.TestCase):
     """Tests for a tag scope."""
     def setUp(self):
-        e = fixture.parse_xml("""<Program Name="MainProgram" TestEdits="false" MainRoutineName="MainRoutine" Disabled="false">
+        e = fixture.parse_xml_copy("""<Program Name="MainProgram" TestEdits="false" MainRoutineName="MainRoutine" Disabled="false">
 <Tags>
 <Tag Name="bar" TagType="Base" DataType="DINT" Radix="Decimal" Constant="false" ExternalAccess="Read/Write">
 <Data>00 00 00 00</Data>
@@ -69,7 +69,9 @@ class Scope(unittest.TestCase):
 class Tag(object):
     """Base class for testing a tag."""
     def setUp(self):
-        e = fixture.parse_xml(self.src_xml)
+        # Each test gets a separate copy of the source element because
+        # most tests modify the tag.
+        e = fixture.parse_xml_copy(self.src_xml)
         self.tag = l5x.tag.Tag(e, None)
 
         # Initialize a fresh copy of the source XML value, if available.
@@ -114,6 +116,14 @@ class Tag(object):
         children = parent.findall('*')
         return children[0]
 
+    def add_comment(self, operand, text):
+        """Creates a comment for an operand, adding Comments if necessary."""
+        comments = self.tag.element.find('Comments')
+        if comments is None:
+            comments = ElementTree.SubElement(self.tag.element, 'Comments')
+        comment = ElementTree.SubElement(comments, 'Comment', Operand=operand)
+        ElementTree.SubElement(comment, dom.CDATA_TAG).text = text
+
 
 class Data(unittest.TestCase):
     """Unit tests for the base Data class."""
@@ -200,13 +210,11 @@ class Integer(Tag):
         except TypeError:
             pass
                 
-    def test_value_min(self):
-        """Confirm the minimum value is accepted."""
-        self.tag.value = self.value_min
-
-    def test_value_max(self):
-        """Confirm the maximum value is accepted."""
-        self.tag.value = self.value_max
+    def test_value_limits(self):
+        """Confirm the minimum and maximum values are accepted."""
+        for value in (self.value_min, self.value_max):
+            self.tag.value = value
+            self.assertEqual(self.get_value(), value)
 
     def test_invalid_bit_indices(self):
         """Verify invalid bit indices raise an exception."""
@@ -222,26 +230,17 @@ class Integer(Tag):
 
     def test_bit_value_read(self):
         """Confirm non-sign bits reflect the current integer value."""
-        for bit in range(self.bits - 1):
-            # Check setting only the target bit.
-            value = 1 << bit
-            self.set_value(value)
-            for test_bit in range(self.bits):
-                if test_bit == bit:
-                    test_value = 1
-                else:
-                    test_value = 0
-                self.assertEqual(self.tag[test_bit].value, test_value)
-
-            # Check setting all except the target bit.
-            value = ~(1 << bit)
-            self.set_value(value)
-            for test_bit in range(self.bits):
-                if test_bit == bit:
-                    test_value = 0
-                else:
-                    test_value = 1
-                self.assertEqual(self.tag[test_bit].value, test_value)
+        tag = self.tag
+        bits = self.bits
+        for bit in range(bits - 1):
+            # Check setting only the target bit, then all except the
+            # target bit; each bit's expected value is taken directly
+            # from the integer value.
+            for value in [1 << bit, ~(1 << bit)]:
+                self.set_value(value)
+                for test_bit in range(bits):
+                    self.assertEqual(tag[test_bit].value,
+                                     (value >> test_bit) & 1)
 
     def test_bit_value_write(self):
         """Confirm writing non-sign bits properly update the integer value."""
@@ -273,6 +272,25 @@ class Integer(Tag):
         value = self.get_value()
         self.assertEqual(value, min_negative)
 
+    def test_sign_bit_ctypes(self):
+        """Confirm sign bit access matches exact-width ctypes arithmetic."""
+        sign_bit = self.bits - 1
+        mask = self.ctype(1 << sign_bit).value
+        for value in (0, 1, -1, self.value_min, self.value_max):
+            self.set_value(value)
+            expected = 1 if self.ctype(value).value & mask else 0
+            self.assertEqual(self.tag[sign_bit].value, expected)
+
+            for bit_value in (0, 1):
+                self.set_value(value)
+                self.tag[sign_bit].value = bit_value
+                cvalue = self.ctype(value)
+                if bit_value:
+                    cvalue.value |= mask
+                else:
+                    cvalue.value &= ~mask
+                self.assertEqual(self.get_value(), cvalue.value)
+
     def test_bit_write_type(self):
         """Confirm an exception is raised when setting a bit to a non-integer."""
         with self.assertRaises(TypeError):
@@ -280,27 +298,30 @@ class Integer(Tag):
 
     def test_bit_value_range(self):
         """Ensure bit values other than 0 or 1 raise an exception."""
-        with self.assertRaises(ValueError):
-            self.tag[0].value = -1
-        with self.assertRaises(ValueError):
-            self.tag[0].value = 2
+        bit = self.tag[0]
+        for value in (-1, 2):
+            with self.assertRaises(ValueError):
+                bit.value = value
 
     def test_bit_desc_read(self):
         """Confirm reading an existing bit description."""
+        tag = self.tag
         for bit in range(self.bits):
             comment_text = "comment for bit {0}".format(bit)
             self.add_bit_description(bit, comment_text)
-            self.assertEqual(self.tag[bit].description, comment_text)
+            self.assertEqual(tag[bit].description, comment_text)
 
     def test_bit_desc_read_none(self):
         """Confirm reading a nonexistent bit description."""
+        tag = self.tag
         for bit in range(self.bits):
-            self.assertIsNone(self.tag[bit].description)
+            self.assertIsNone(tag[bit].description)
 
     def test_bit_desc_read_none_other(self):
         """Confirm reading a nonexistent bit comment when other comments exist."""
+        tag = self.tag
         for bit in range(self.bits):
-            self.assertIsNone(self.tag[bit].description)
+            self.assertIsNone(tag[bit].description)
 
             # Add the comment after checking to create unrelated comments
             # for the next bit.
@@ -309,28 +330,31 @@ class Integer(Tag):
 
     def test_bit_desc_write_new(self):
         """Confirm creating a new bit description."""
+        tag = self.tag
         for bit in range(self.bits):
             comment = "bit {0}".format(bit)
-            self.tag[bit].description = comment
+            tag[bit].description = comment
             self.assert_bit_description(bit, comment)
 
     def test_bit_desc_overwrite(self):
         """Confirm overwriting an existing bit description."""
+        tag = self.tag
         for bit in range(self.bits):
             old = "old bit {0} comment".format(bit)
             self.add_bit_description(bit, old)
             new = "new bit {0} comment".format(bit)
-            self.tag[bit].description = new
+            tag[bit].description = new
             self.assert_bit_description(bit, new)
 
     def test_bit_desc_del(self):
         """Confirm removal of an existing bit description."""
+        tag = self.tag
+        path = "Comments/Comment[@Operand='.{0}']"
         for bit in range(self.bits):
             desc = "bit {0} comment".format(bit)
             self.add_bit_description(bit, desc)
-            self.tag[bit].description = None
-            path = "Comments/Comment[@Operand='.{0}']".format(bit)
-            comment = self.tag.element.findall(path)
+            tag[bit].description = None
+            comment = tag.element.findall(path.format(bit))
             self.assertEqual(len(comment), 0)
 
     def test_bit_value_raw_data(self):
@@ -350,14 +374,7 @@ class Integer(Tag):
 
     def add_bit_description(self, bit, text):
         """Creates a bit description."""
-        comments = self.tag.element.find('Comments')
-        if comments is None:
-            comments = ElementTree.SubElement(self.tag.element, 'Comments')
-        operand = ".{0}".format(bit)
-        comment = ElementTree.SubElement(comments, 'Comment',
-                                         {'Operand':operand})
-        cdata = ElementTree.SubElement(comment, dom.CDATA_TAG)
-        cdata.text = text
+        self.add_comment(".{0}".format(bit), text)
 
     def assert_bit_description(self, bit, text):
         """Tests to ensure a description for a specific bit exists."""
@@ -371,11 +388,10 @@ class Integer(Tag):
         self.assertEqual(len(comment), 1)
 
         # Confirm a single CDATA child with matching text.
-        cdata = [e for e in comment[0].iter()]
-        del cdata[0] # Exclude the Comment parent.
-        self.assertEqual(len(cdata), 1)
-        self.assertEqual(cdata[0].tag, dom.CDATA_TAG)
-        self.assertEqual(cdata[0].text, text)
+        self.assertEqual(len(comment[0]), 1)
+        cdata = comment[0][0]
+        self.assertEqual(cdata.tag, dom.CDATA_TAG)
+        self.assertEqual(cdata.text, text)
 
 
 class TestSINT(Integer, unittest.TestCase):
@@ -388,6 +404,7 @@ class TestSINT(Integer, unittest.TestCase):
 
     xml_value = 0
     bits = 8
+    ctype = ctypes.c_int8
     value_min = -128
     value_max = 127
 
@@ -402,6 +419,7 @@ class TestINT(Integer, unittest.TestCase):
 
     xml_value = 0
     bits = 16
+    ctype = ctypes.c_int16
     value_min = -32768
     value_max = 32767
 
@@ -416,6 +434,7 @@ class TestDINT(Integer, unittest.TestCase):
 
     xml_value = 0
     bits = 32
+    ctype = ctypes.c_int32
     value_min = -2147483648
     value_max = 2147483647
 
@@ -623,12 +642,7 @@ class TestSingleDimensionalArray(Tag, unittest.TestCase):
 
     def set_comment(self, index, text):
         """Creates a comment for a single element."""
-        comments = ElementTree.SubElement(self.tag.element, 'Comments')
-        operand = "[{0}]".format(index)
-        comment = ElementTree.SubElement(comments, 'Comment',
-                                         {'Operand':operand})
-        cdata = ElementTree.SubElement(comment, dom.CDATA_TAG)
-        cdata.text = text
+        self.add_comment("[{0}]".format(index), text)
 
     def get_comment(self, index):
         """Finds a comment for a single element."""
@@ -701,13 +715,14 @@ class TestMultiDimensionalArray(Tag, unittest.TestCase):
 
     def test_value_read(self):
         """Verify reading values for each dimension."""
-        self.assertEqual(self.tag.value, self.src_value)
+        tag = self.tag
+        self.assertEqual(tag.value, self.src_value)
 
-        for i in range(len(self.tag.value)):
-            self.assertEqual(self.tag.value[i], self.src_value[i])
+        for i in range(len(self.src_value)):
+            self.assertEqual(tag[i].value, self.src_value[i])
 
-            for j in range(len(self.tag.value[i])):
-                self.assertEqual(self.tag.value[i][j], self.src_value[i][j])
+            for j in range(len(self.src_value[i])):
+                self.assertEqual(tag[i][j].value, self.src_value[i][j])
 
     def test_value_write_single(self):
         """Verify writing a single element value."""
@@ -743,8 +758,7 @@ class TestMultiDimensionalArray(Tag, unittest.TestCase):
         """Confirms all element values match the source array."""
         # Iterate though all the source array values and confirm a
         # matching XML element value.
-        indices = [range(self.tag.shape[x]) for x in range(len(self.tag.shape))]
-        indices.reverse()
+        indices = [range(d) for d in reversed(self.tag.shape)]
         for subscript in itertools.product(*indices):
             # Acquire the value stored in the XML attribute.
             index = "[{0}]".format(','.join([str(i) for i in subscript]))
@@ -774,6 +788,17 @@ class TestMultiDimensionalArray(Tag, unittest.TestCase):
 
             self.assertEqual(xml_value, src_value)
 
+    def test_member_parent(self):
+        """Confirm an element's parent is the subarray it was accessed from."""
+        subarray = self.tag[1][2]
+        self.assertIs(subarray[3].parent, subarray)
+
+    def test_subarray_child_index(self):
+        """Confirm subarrays share the top-level array's child index."""
+        index = self.tag.data.members.child_index
+        self.assertIs(self.tag[1].members.child_index, index)
+        self.assertIs(self.tag[1][2].members.child_index, index)
+
     def test_subarray_description(self):
         """Confirm descriptions are not permitted for subarrays."""
         ar = self.tag
@@ -816,14 +841,12 @@ class ArrayResize(Tag):
 
         # Get indices from all the XML elements.
         array = self.tag.element.find('Data/Array')
-        xml_idx = set([e.attrib['Index'] for e in array])
+        xml_idx = set(e.attrib['Index'] for e in array)
 
         # Create indices from the expected dimensions.
-        ranges = [range(self.dim[i]) for i in range(len(self.dim))]
-        ranges.reverse()
-        new_idx = set()
-        for idx in itertools.product(*ranges):
-            new_idx.add("[{0}]".format(','.join([str(x) for x in idx])))
+        ranges = [range(d) for d in reversed(self.dim)]
+        new_idx = set("[{0}]".format(','.join(str(x) for x in idx))
+                      for idx in itertools.product(*ranges))
 
         self.assertEqual(xml_idx, new_idx)
 
@@ -1007,6 +1030,9 @@ class Structure(Tag, unittest.TestCase):
         'DN':1
     }
 
+    # Status bits cleared by the write tests; copied into each new value.
+    CLEARED_FLAGS = {'EN':0, 'TT':0, 'DN':0}
+
     def test_invalid_value_type(self):
         """Test setting value to a non-dict raises an exception."""
         with self.assertRaises(TypeError):
@@ -1018,7 +1044,7 @@ class Structure(Tag, unittest.TestCase):
 
     def test_value_write(self):
         """Confirm writing a dict to the top-level value.."""
-        self.src_value = {'PRE':42, 'ACC':142, 'EN':0, 'TT':0, 'DN':0}
+        self.src_value = dict(self.CLEARED_FLAGS, PRE=42, ACC=142)
         self.tag.value = self.src_value
         self.assert_member_values()
 
@@ -1046,13 +1072,7 @@ class Structure(Tag, unittest.TestCase):
 
     def test_member_value_write(self):
         """Test writing individual member values."""
-        new_values = {
-            'PRE':200,
-            'ACC':300,
-            'EN':0,
-            'TT':0,
-            'DN':0
-        }
+        new_values = dict(self.CLEARED_FLAGS, PRE=200, ACC=300)
 
         for name in self.src_value:
             self.tag[name].value = new_values[name]
@@ -1089,17 +1109,11 @@ class Structure(Tag, unittest.TestCase):
         """Confirms the value of all data members match the source dict."""
         st = self.tag.element.find('Data/Structure')
 
-        # Confirm all XML values match the source dict.
-        for e in st:
-            value = int(e.attrib['Value'])
-            name = e.attrib['Name']
-            self.assertEqual(self.src_value[name], value)
-
-        # Confirm all source dict members match the XML values.
-        for name in self.src_value:
-            e = st.find('*[@Name="{0}"]'.format(name))
-            value = int(e.attrib['Value'])
-            self.assertEqual(self.src_value[name], value)
+        # Collect every XML member value in a single pass; comparing
+        # the whole dict confirms both directions at once.
+        xml_values = dict((e.attrib['Name'], int(e.attrib['Value']))
+                          for e in st)
+        self.assertDictEqual(xml_values, self.src_value)
 
 
 class Compound(Tag, unittest.TestCase):
@@ -1136,7 +1150,7 @@ class Base(unittest.TestCase):
     """Tests for base, i.e. not produced or consumed, tags."""
     def setUp(self):
         """Creates a mock base tag."""
-        e = fixture.parse_xml("""<Tag Name="dint" TagType="Base" DataType="DINT" Radix="Decimal" Constant="false" ExternalAccess="Read/Write">
+        e = fixture.parse_xml_copy("""<Tag Name="dint" TagType="Base" DataType="DINT" Radix="Decimal" Constant="false" ExternalAccess="Read/Write">
 <Data>00 00 00 00</Data>
 <Data Format="Decorated">
 <DataValue DataType="DINT" Radix="Decimal" Value="0"/>
@@ -1174,7 +1188,7 @@ class Base(unittest.TestCase):
 class Consumed(unittest.TestCase):
     """Tests for attributes specific to consumed tags."""
     def setUp(self):
-        e = fixture.parse_xml("""<Tag Name="dint" TagType="Consumed" DataType="DINT" Radix="Decimal" ExternalAccess="Read/Write">
+        e = fixture.parse_xml_copy("""<Tag Name="dint" TagType="Consumed" DataType="DINT" Radix="Decimal" ExternalAccess="Read/Write">
 <ConsumeInfo Producer="producer" RemoteTag="source_tag" RemoteInstance="0" RPI="20"/>
 <Data>00 00 00 00</Data>
 <ForceData>00 00 00 00 00 00 00 00 00 00 00 00</ForceData>
@@ -1231,6 +1245,7 @@ class Consumed(unittest.TestCase):
 class LanguageBase(unittest.TestCase):
     """Base class for tests involving multilanguage comments and descriptions."""
     TARGET_LANGUAGE = 'en-US'
+    FOREIGN_LANGUAGE = 'zh-CN' # Language of the 'other' mock content.
 
     def create_tag(self, xml_str):
         e = fixture.parse_xml(xml_str)
@@ -1249,21 +1264,30 @@ class LanguageBase(unittest.TestCase):
         for details.
         """
         # Confirm the parent element contains a single CDATA subelement.
-        children = [e for e in parent.iterfind('*')]
-        self.assertEqual(len(children), 1)
-        self.assertEqual(children[0].tag, dom.CDATA_TAG)
+        self.assertEqual(len(parent), 1)
+        cdata = parent[0]
+        self.assertEqual(cdata.tag, dom.CDATA_TAG)
 
         # Confirm the content of the new CDATA section.
-        self.assertEqual(children[0].text, text)
+        self.assertEqual(cdata.text, text)
 
     def assert_no_matching_element(self, path):
         """Verifies a given XPath does not match under the mock tag element."""
-        result = self.tag.element.findall(path)
-        self.assertEqual(len(result), 0)
+        self.assertIsNone(self.tag.element.find(path))
+
+    def find_single(self, parent, path):
+        """Finds the one and only element matching an XPath under a parent."""
+        matches = parent.iterfind(path)
+        element = next(matches, None)
+        self.assertIsNotNone(element)
+        self.assertIsNone(next(matches, None))
+        return element
 
 
 class DescriptionLanguage(LanguageBase):
     """Tests for multilanguage descriptions."""
+    LOCALIZED_PATH = "Description/LocalizedDescription[@Lang='{0}']"
+
     def test_single_read(self):
         """Confirm reading a description from a single-language project."""
         self.create_tag("""<Tag Name="tag" TagType="Base" DataType="DINT" Radix="Decimal" Constant="false" ExternalAccess="Read/Write">
@@ -1385,7 +1409,7 @@ class DescriptionLanguage(LanguageBase):
         self.set_multilanguage()
         self.tag.description = 'new'
         self.assert_localized_description('new', self.TARGET_LANGUAGE)
-        self.assert_localized_description('other', 'zh-CN')
+        self.assert_localized_description('other', self.FOREIGN_LANGUAGE)
 
     def test_single_overwrite(self):
         """
@@ -1447,7 +1471,7 @@ class DescriptionLanguage(LanguageBase):
         self.set_multilanguage()
         self.tag.description = 'new'
         self.assert_localized_description('new', self.TARGET_LANGUAGE)
-        self.assert_localized_description('other', 'zh-CN')
+        self.assert_localized_description('other', self.FOREIGN_LANGUAGE)
 
     def test_single_delete(self):
         """Confirm removing a description from a single-language project."""
@@ -1503,35 +1527,35 @@ class DescriptionLanguage(LanguageBase):
         self.tag.description = None
 
         # Ensure no localized description remains in the current language.
-        path = "Description/LocalizedDescription[@Lang='{0}']".format(
-            self.TARGET_LANGUAGE)
+        path = self.LOCALIZED_PATH.format(self.TARGET_LANGUAGE)
         self.assert_no_matching_element(path)
 
         # Ensure descriptions in other languages are unaffected.
-        self.assert_localized_description('other', 'zh-CN')
+        self.assert_localized_description('other', self.FOREIGN_LANGUAGE)
 
     def assert_description(self, text):
         """
         Verifies a single Description element exists under the Tag and
         contains a matching comment.
         """
-        desc = self.tag.element.findall('Description')
-        self.assertEqual(len(desc), 1)
-        self.assert_cdata_content(desc[0], text)
+        desc = self.find_single(self.tag.element, 'Description')
+        self.assert_cdata_content(desc, text)
 
     def assert_localized_description(self, text, language):
         """
         Verifies a single LocalizedDescription element exists under the
         Description element with a language attribute and matching text.
         """
-        path = "Description/LocalizedDescription[@Lang='{0}']".format(language)
-        local_desc = self.tag.element.findall(path)
-        self.assertEqual(len(local_desc), 1)
-        self.assert_cdata_content(local_desc[0], text)
+        path = self.LOCALIZED_PATH.format(language)
+        local_desc = self.find_single(self.tag.element, path)
+        self.assert_cdata_content(local_desc, text)
 
 
 class CommentLanguage(LanguageBase):
     """Tests for multilanguage comments."""
+    COMMENT_PATH = "Comments/Comment[@Operand='{0}']"
+    LOCALIZED_PATH = "LocalizedComment[@Lang='{0}']"
+
     def test_single_read(self):
         """Confirm reading a comment from a single-language project."""
         self.create_tag("""<Tag Name="tag" TagType="Base" DataType="DINT" Radix="Decimal" Constant="false" ExternalAccess="Read/Write">
@@ -1648,7 +1672,7 @@ class CommentLanguage(LanguageBase):
         self.set_multilanguage()
         self.tag[0].description = 'new'
         self.assert_localized_comment('.0', 'new', self.TARGET_LANGUAGE)
-        self.assert_localized_comment('.0', 'other', 'zh-CN')
+        self.assert_localized_comment('.0', 'other', self.FOREIGN_LANGUAGE)
 
     def test_single_overwrite(self):
         """
@@ -1716,7 +1740,7 @@ class CommentLanguage(LanguageBase):
         self.set_multilanguage()
         self.tag[0].description = 'new'
         self.assert_localized_comment('.0', 'new', self.TARGET_LANGUAGE)
-        self.assert_localized_comment('.0', 'other', 'zh-CN')
+        self.assert_localized_comment('.0', 'other', self.FOREIGN_LANGUAGE)
 
     def test_single_delete(self):
         """Confirm removing a comment from a single-language project."""
@@ -1756,7 +1780,7 @@ class CommentLanguage(LanguageBase):
         self.tag[0].description = None
 
         # Confirm the target comment was removed.
-        self.assert_no_matching_element("Comments/Comment[@Operand='.0']")
+        self.assert_no_matching_element(self.COMMENT_PATH.format('.0'))
 
         # Confirm the unaffected comment remains.
         self.assert_comment('.1', 'bar')
@@ -1830,8 +1854,8 @@ class CommentLanguage(LanguageBase):
         self.tag[0].description = None
 
         # Confirm the target comment was removed.
-        path = "Comments/Comment[@Operand='.0']" \
-               "/LocalizedComment[@Lang='{0}']".format(self.TARGET_LANGUAGE)
+        path = '/'.join((self.COMMENT_PATH.format('.0'),
+                         self.LOCALIZED_PATH.format(self.TARGET_LANGUAGE)))
         self.assert_no_matching_element(path)
 
         # Confirm the unaffected comment remains.
@@ -1888,7 +1912,7 @@ class CommentLanguage(LanguageBase):
 </Tag>""")
         self.set_multilanguage()
         self.tag[0].description = None
-        self.assert_localized_comment('.0', 'other', 'zh-CN')
+        self.assert_localized_comment('.0', 'other', self.FOREIGN_LANGUAGE)
 
     def assert_comment(self, operand, text):
         """
@@ -1904,23 +1928,20 @@ class CommentLanguage(LanguageBase):
         element with a language attribute and matching text.
         """
         comment = self.get_comment(operand)
-        path = "LocalizedComment[@Lang='{0}']".format(language)
-        localized = comment.findall(path)
-        self.assertEqual(len(localized), 1)
-        self.assert_cdata_content(localized[0], text)
+        path = self.LOCALIZED_PATH.format(language)
+        localized = self.find_single(comment, path)
+        self.assert_cdata_content(localized, text)
 
     def get_comment(self, operand):
         """Finds a Comment element with a matching operand attribute."""
-        path = "Comments/Comment[@Operand='{0}']".format(operand)
-        comment = self.tag.element.findall(path)
-        self.assertEqual(len(comment), 1)
-        return comment[0]
+        path = self.COMMENT_PATH.format(operand)
+        return self.find_single(self.tag.element, path)
 
 
 class AliasFor(unittest.TestCase):
     """Tests for the alias_for attribute of alias tags."""
     def setUp(self):
-        e = fixture.parse_xml(r"""<Tag Name="alias" TagType="Alias" Radix="Decimal" AliasFor="tag" ExternalAccess="Read/Write">
+        e = fixture.parse_xml_copy(r"""<Tag Name="alias" TagType="Alias" Radix="Decimal" AliasFor="tag" ExternalAccess="Read/Write">
 <Comments>
 <Comment Operand=".0">
 <![CDATA[alias operand comment]]>